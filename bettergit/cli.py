@@ -349,14 +349,32 @@ def commit_save(args):
 def _show_git_status():
     """Show a formatted git status."""
     try:
-        # Get detailed status
-        status_output, _, _ = run_git_command(['status', '--porcelain'])
+        # Get detailed status; --branch adds a "## branch...upstream" header
+        # line so tracking info comes from the same git call
+        status_output, _, _ = run_git_command(['status', '--porcelain', '--branch'])
+        
+        lines = status_output.split('\n')
+        header = lines[0][3:] if lines[0].startswith('## ') else ''
+        has_commits = not header.startswith(('No commits yet on ', 'Initial commit on '))
+        remote_branch = None
+        upstream_gone = False
+        ahead = 0
+        behind = 0
+        if '...' in header:
+            remote_branch, _, counts = header.split('...', 1)[1].partition(' [')
+            for count in counts.rstrip(']').split(', '):
+                if count == 'gone':
+                    upstream_gone = True
+                elif count.startswith('ahead '):
+                    ahead = int(count[len('ahead '):])
+                elif count.startswith('behind '):
+                    behind = int(count[len('behind '):])
         
         staged = []
         modified = []
         untracked = []
         
-        for line in status_output.split('\n'):
+        for line in lines[1:] if header else lines:
             if not line:
                 continue
             
@@ -373,6 +391,11 @@ def _show_git_status():
         # Display status summary
         status_info = {
             'branch': get_current_branch(),
+            'remote_branch': remote_branch,
+            'upstream_gone': upstream_gone,
+            'ahead': ahead,
+            'behind': behind,
+            'has_commits': has_commits,
             'staged': staged,
             'modified': modified,
             'untracked': untracked
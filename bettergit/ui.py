@@ -1,17 +1,18 @@
 """User interface utilities for interactive prompts and displays."""
 
-import inquirer
 from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
 from rich.text import Text
-from rich.tree import Tree
 from typing import List, Dict, Any, Optional, Union
 import logging
 import sys
 import os
-import emoji
+import codecs
+import getpass
+import select
+from itertools import groupby
 
+# inquirer and the rich table/panel/tree modules are imported inside the
+# functions that use them so commands that only print stay fast to start.
 
 logger = logging.getLogger(__name__)
 
@@ -19,12 +20,12 @@ logger = logging.getLogger(__name__)
 def _test_unicode_support():
     """Test if the current terminal supports emoji output."""
     try:
-        # Try to encode some test emojis with the system encoding
-        test_emoji = "✅🌿📋"
-        test_emoji.encode(sys.stdout.encoding or 'utf-8')
-        return True
-    except (UnicodeEncodeError, LookupError):
+        # Only the UTF codecs can encode emojis; resolve aliases such as
+        # cp65001 through the codec registry instead of encoding a sample
+        encoding = codecs.lookup(sys.stdout.encoding or 'utf-8').name
+    except LookupError:
         return False
+    return encoding.startswith('utf')
 
 # Determine symbol set based on terminal capabilities
 _CAN_USE_EMOJI = _test_unicode_support()
@@ -72,18 +73,25 @@ else:
         'lock': 'L',
     }
 
+# Only emit ANSI styling when stdout is an interactive terminal
+_IS_TTY = sys.stdout.isatty()
+
 # Configure console appropriately
 if _CAN_USE_EMOJI:
     console = Console(
-        force_terminal=True,
+        force_terminal=_IS_TTY,
+        no_color=not _IS_TTY,
         width=None,
-        emoji=True
+        emoji=True,
+        highlight=False
     )
 else:
     console = Console(
-        force_terminal=True,
+        force_terminal=_IS_TTY,
+        no_color=not _IS_TTY,
         width=None,
-        legacy_windows=True
+        legacy_windows=True,
+        highlight=False
     )
 
 
@@ -92,45 +100,79 @@ class UIError(Exception):
     pass
 
 
-def _safe_print(content, **kwargs):
+# Cleared after the first console failure so later prints go straight to
+# the plain-text fallback instead of retrying Rich every time
+_CONSOLE_OK = True
+
+
+def _is_plain_text(objects, markup: bool = True) -> bool:
+    """Check whether objects can be written as-is without Rich rendering."""
+    for obj in objects:
+        if isinstance(obj, Text):
+            continue
+        if not isinstance(obj, str) or (markup and '[' in obj):
+            return False
+    return True
+
+
+def _safe_print(*objects, **kwargs):
     """Safely print content to the console."""
-    try:
-        console.print(content, **kwargs)
-    except Exception as e:
-        # Last resort: print as plain text
-        logger.error(f"Console print failed: {e}")
-        print(str(content))
+    global _CONSOLE_OK
+    if not _IS_TTY and _is_plain_text(objects, kwargs.get('markup', True)):
+        # Redirected output gets no styling, so skip Rich's render pipeline
+        sys.stdout.write(kwargs.get('sep', ' ').join(map(str, objects)) + '\n')
+        return
+    if _CONSOLE_OK:
+        try:
+            console.print(*objects, **kwargs)
+            return
+        except Exception as e:
+            _CONSOLE_OK = False
+            logger.error(f"Console print failed: {e}")
+    # Last resort: print as plain text
+    print(*(str(obj) for obj in objects), sep=kwargs.get('sep', ' '))
+
+
+# Prebuilt message prefixes so the print_* helpers skip markup parsing and
+# per-call symbol formatting
+_PREFIX_SUCCESS = Text(f"{SYMBOLS['success']} ", style="bold green")
+_PREFIX_ERROR = Text(f"{SYMBOLS['error']} ", style="bold red")
+_PREFIX_WARNING = Text(f"{SYMBOLS['warning']} ", style="bold yellow")
+_PREFIX_INFO = Text(f"{SYMBOLS['info']}  ", style="bold blue")
 
 
 def print_success(message: str):
     """Print a success message in green."""
-    _safe_print(f"{SYMBOLS['success']} {message}", style="bold green")
+    _safe_print(_PREFIX_SUCCESS, message, style="bold green", sep="", markup=False)
 
 
 def print_error(message: str):
     """Print an error message in red."""
-    _safe_print(f"{SYMBOLS['error']} {message}", style="bold red")
+    _safe_print(_PREFIX_ERROR, message, style="bold red", sep="", markup=False)
 
 
 def print_warning(message: str):
     """Print a warning message in yellow."""
-    _safe_print(f"{SYMBOLS['warning']} {message}", style="bold yellow")
+    _safe_print(_PREFIX_WARNING, message, style="bold yellow", sep="", markup=False)
 
 
 def print_info(message: str):
     """Print an info message in blue."""
-    _safe_print(f"{SYMBOLS['info']}  {message}", style="bold blue")
+    _safe_print(_PREFIX_INFO, message, style="bold blue", sep="", markup=False)
+
+
+def _prompt_label(message: str) -> str:
+    """Strip trailing whitespace and colons so a prompt suffix can be appended."""
+    return message.rstrip().rstrip(':')
 
 
 def confirm(message: str, default: bool = False) -> bool:
     """Show a yes/no confirmation prompt."""
     try:
-        questions = [
-            inquirer.Confirm('confirm', message=message, default=default)
-        ]
-        answers = inquirer.prompt(questions)
-        return answers['confirm'] if answers else default
-    except KeyboardInterrupt:
+        hint = 'Y/n' if default else 'y/N'
+        answer = input(f"{_prompt_label(message)} [{hint}]: ").strip().lower()
+        return answer.startswith('y') if answer else default
+    except (KeyboardInterrupt, EOFError):
         return False
     except Exception as e:
         logger.error(f"Confirmation prompt failed: {e}")
@@ -140,12 +182,11 @@ def confirm(message: str, default: bool = False) -> bool:
 def prompt_text(message: str, default: str = "") -> str:
     """Show a text input prompt."""
     try:
-        questions = [
-            inquirer.Text('input', message=message, default=default)
-        ]
-        answers = inquirer.prompt(questions)
-        return answers['input'] if answers else default
-    except KeyboardInterrupt:
+        label = _prompt_label(message)
+        if default:
+            label += f" [{default}]"
+        return input(f"{label}: ") or default
+    except (KeyboardInterrupt, EOFError):
         return default
     except Exception as e:
         logger.error(f"Text prompt failed: {e}")
@@ -155,12 +196,8 @@ def prompt_text(message: str, default: str = "") -> str:
 def prompt_password(message: str) -> str:
     """Show a password input prompt (hidden input)."""
     try:
-        questions = [
-            inquirer.Password('password', message=message)
-        ]
-        answers = inquirer.prompt(questions)
-        return answers['password'] if answers else ""
-    except KeyboardInterrupt:
+        return getpass.getpass(f"{_prompt_label(message)}: ")
+    except (KeyboardInterrupt, EOFError):
         return ""
     except Exception as e:
         logger.error(f"Password prompt failed: {e}")
@@ -171,6 +208,8 @@ def select_from_list(message: str, choices: List[Union[str, tuple]],
                     default: Optional[str] = None) -> Optional[str]:
     """Show a selection list."""
     try:
+        import inquirer
+        
         if not choices:
             print_warning("No options available to select from.")
             return None
@@ -187,29 +226,58 @@ def select_from_list(message: str, choices: List[Union[str, tuple]],
         return None
 
 
+# Arrow keys mapped to selection movement: the second byte msvcrt.getch()
+# returns after the b'\xe0' prefix on Windows, and the escape sequences
+# (normal and application cursor mode) split out of raw input on Unix
+_WIN_ARROW_KEYS = {b'H': -1, b'P': 1}
+_UNIX_ARROW_KEYS = {b'\x1b[A': -1, b'\x1b[B': 1, b'\x1bOA': -1, b'\x1bOB': 1}
+
+
+def _split_unix_keys(buf: bytes) -> List[bytes]:
+    """Split raw terminal input into keys.
+    
+    Complete CSI/SS3 escape sequences (e.g. b'\\x1b[A') are kept together,
+    a lone ESC is returned as b'\\x1b' and every other byte is its own key.
+    """
+    keys = []
+    i = 0
+    while i < len(buf):
+        start = i
+        if buf[i:i + 2] in (b'\x1b[', b'\x1bO'):
+            i += 2
+            # Parameter bytes run until the final byte in 0x40-0x7e
+            while i < len(buf) and not 0x40 <= buf[i] <= 0x7e:
+                i += 1
+        i += 1
+        keys.append(buf[start:i])
+    return keys
+
+
 def select_undo_point(message: str, choices: List[str]) -> Optional[int]:
     """Show a custom undo point selection with progressive highlighting.
     
     Returns the index of the selected choice, or None if cancelled.
     """
     try:
-        import msvcrt
-        import os
-        
         if not choices:
             print_warning("No options available to select from.")
             return None
         
+        if os.name != 'nt' and not sys.stdin.isatty():
+            raise UIError("Interactive selection requires a terminal")
+        
         current_pos = 0
         menu_lines_printed = 0
         header_displayed = False
+        # Position and window start of the last drawn frame, used to
+        # redraw only the rows that changed
+        prev_pos = None
+        prev_start_idx = None
         
         def clear_menu_lines(num_lines):
             """Clear only the menu lines, not the header."""
-            if num_lines > 0:
-                # Move cursor up and clear each line
-                for _ in range(num_lines):
-                    print('\033[1A\033[2K', end='')  # Move up one line and clear it
+            # Move up one line and clear it, once per menu line
+            return '\033[1A\033[2K' * num_lines
         
         def display_header():
             """Display the static header only once."""
@@ -217,11 +285,19 @@ def select_undo_point(message: str, choices: List[str]) -> Optional[int]:
             print("Use arrow keys to navigate, Enter to select, Esc or Ctrl+C to cancel")
             print()  # Empty line for spacing
         
+        def render_row(i):
+            """Render the menu row for choice i (without trailing newline)."""
+            choice = choices[i]
+            if i <= current_pos:
+                # Highlight selected items in blue with > prefix
+                if i == current_pos:
+                    return f"\033[94m\033[7m> {choice}\033[0m"  # Reverse video for current selection
+                return f"\033[94m> {choice}\033[0m"
+            # Normal display for unselected items
+            return f"  {choice}"
+        
         def display_menu():
-            nonlocal menu_lines_printed
-            
-            # Clear previous menu output (but not header)
-            clear_menu_lines(menu_lines_printed)
+            nonlocal menu_lines_printed, prev_pos, prev_start_idx
             
             # Calculate visible window for large lists
             max_visible = 10  # Show max 10 items at once
@@ -232,33 +308,56 @@ def select_undo_point(message: str, choices: List[str]) -> Optional[int]:
             if end_idx - start_idx < max_visible and start_idx > 0:
                 start_idx = max(0, end_idx - max_visible)
             
+            if prev_pos is not None and start_idx == prev_start_idx:
+                # Window didn't scroll: only the rows between the old and new
+                # position change, so rewrite those in place and return the
+                # cursor to the bottom of the menu
+                first_row = 1 if start_idx > 0 else 0
+                parts = []
+                for i in range(min(prev_pos, current_pos), max(prev_pos, current_pos) + 1):
+                    up = menu_lines_printed - (first_row + i - start_idx)
+                    parts.append(f"\033[{up}A\r\033[2K{render_row(i)}\033[{up}B\r")
+                sys.stdout.write(''.join(parts))
+                sys.stdout.flush()
+                prev_pos = current_pos
+                return
+            
+            # Clear previous menu output (but not header); the whole frame
+            # is collected in parts and written with a single call
+            parts = [clear_menu_lines(menu_lines_printed)]
+            
             lines_count = 0  # No dynamic counter line
             
             # Show ellipsis if there are items above
             if start_idx > 0:
-                print("  ...")
+                parts.append("  ...\n")
                 lines_count += 1
             
             # Display visible choices
             for i in range(start_idx, end_idx):
-                choice = choices[i]
-                if i <= current_pos:
-                    # Highlight selected items in blue with > prefix
-                    if i == current_pos:
-                        print(f"\033[94m\033[7m> {choice}\033[0m")  # Reverse video for current selection
-                    else:
-                        print(f"\033[94m> {choice}\033[0m")
-                else:
-                    # Normal display for unselected items
-                    print(f"  {choice}")
+                parts.append(render_row(i) + "\n")
                 lines_count += 1
             
             # Show ellipsis if there are items below
             if end_idx < len(choices):
-                print("  ...")
+                parts.append("  ...\n")
                 lines_count += 1
             
+            sys.stdout.write(''.join(parts))
+            sys.stdout.flush()
             menu_lines_printed = lines_count
+            prev_pos = current_pos
+            prev_start_idx = start_idx
+        
+        def move(delta):
+            """Move the selection by delta rows, redrawing only if it changed."""
+            nonlocal current_pos
+            if delta is None:
+                return
+            new_pos = max(0, min(len(choices) - 1, current_pos + delta))
+            if new_pos != current_pos:
+                current_pos = new_pos
+                display_menu()
         
         # Display header once
         display_header()
@@ -267,53 +366,58 @@ def select_undo_point(message: str, choices: List[str]) -> Optional[int]:
         # Initial menu display
         display_menu()
         
-        while True:
-            # Get key input
-            if os.name == 'nt':  # Windows
+        if os.name == 'nt':  # Windows
+            import msvcrt
+            
+            while True:
                 key = msvcrt.getch()
                 if key == b'\xe0':  # Arrow key prefix on Windows
-                    key = msvcrt.getch()
-                    if key == b'H':  # Up arrow
-                        if current_pos > 0:
-                            current_pos -= 1
-                            display_menu()
-                    elif key == b'P':  # Down arrow
-                        if current_pos < len(choices) - 1:
-                            current_pos += 1
-                            display_menu()
+                    move(_WIN_ARROW_KEYS.get(msvcrt.getch()))
                 elif key == b'\r':  # Enter key
                     return current_pos
                 elif key == b'\x1b':  # Escape key
                     return None
                 elif key == b'\x03':  # Ctrl+C
                     return None
-            else:  # Unix/Linux/macOS
-                import sys, tty, termios
-                fd = sys.stdin.fileno()
-                old_settings = termios.tcgetattr(fd)
-                try:
-                    tty.setraw(sys.stdin.fileno())
-                    key = sys.stdin.read(1)
-                    if key == '\x1b':  # Escape sequence
-                        key2 = sys.stdin.read(1)
-                        if key2 == '[':
-                            key3 = sys.stdin.read(1)
-                            if key3 == 'A':  # Up arrow
-                                if current_pos > 0:
-                                    current_pos -= 1
-                                    display_menu()
-                            elif key3 == 'B':  # Down arrow
-                                if current_pos < len(choices) - 1:
-                                    current_pos += 1
-                                    display_menu()
-                        elif key2 == '':  # Just escape
+        else:  # Unix/Linux/macOS
+            import tty, termios
+            
+            fd = sys.stdin.fileno()
+            old_settings = termios.tcgetattr(fd)
+            try:
+                # Enter raw mode once for the whole session. Output
+                # post-processing stays on so menu redraws still map \n to
+                # \r\n, and VMIN=1/VTIME=0 makes os.read return as soon as
+                # any input is available.
+                tty.setraw(fd)
+                attrs = termios.tcgetattr(fd)
+                attrs[1] |= termios.OPOST
+                attrs[6][termios.VMIN] = 1
+                attrs[6][termios.VTIME] = 0
+                termios.tcsetattr(fd, termios.TCSANOW, attrs)
+                
+                while True:
+                    buf = os.read(fd, 8)
+                    # On slow links an escape sequence can arrive split
+                    # across reads; wait briefly for the rest before
+                    # treating a trailing ESC as a bare Escape key
+                    while (buf.endswith((b'\x1b', b'\x1b[', b'\x1bO'))
+                           and select.select([fd], [], [], 0.05)[0]):
+                        buf += os.read(fd, 8)
+                    
+                    # A single read may also hold several keys (auto-repeat)
+                    for key in _split_unix_keys(buf):
+                        delta = _UNIX_ARROW_KEYS.get(key)
+                        if delta is not None:
+                            move(delta)
+                        elif key in (b'\r', b'\n'):  # Enter
+                            return current_pos
+                        elif key == b'\x1b':  # Just escape
                             return None
-                    elif key == '\r' or key == '\n':  # Enter
-                        return current_pos
-                    elif key == '\x03':  # Ctrl+C
-                        return None
-                finally:
-                    termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
+                        elif key == b'\x03':  # Ctrl+C
+                            return None
+            finally:
+                termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
                     
     except KeyboardInterrupt:
         return None
@@ -329,6 +433,8 @@ def select_undo_point(message: str, choices: List[str]) -> Optional[int]:
 def select_multiple(message: str, choices: List[Union[str, tuple]]) -> List[str]:
     """Show a multiple selection checkbox list."""
     try:
+        import inquirer
+        
         if not choices:
             print_warning("No options available to select from.")
             return []
@@ -349,6 +455,8 @@ def display_table(title: str, headers: List[str], rows: List[List[str]],
                   show_lines: bool = True):
     """Display a formatted table."""
     try:
+        from rich.table import Table
+        
         table = Table(title=title, show_lines=show_lines)
         
         for header in headers:
@@ -366,15 +474,13 @@ def display_table(title: str, headers: List[str], rows: List[List[str]],
 def display_list(title: str, items: List[str], numbered: bool = True):
     """Display a formatted list."""
     try:
+        # Build the whole block and print it once; each console.print
+        # is a full markup parse and render pass.
         if numbered:
-            _safe_print(f"\n[bold cyan]{title}[/bold cyan]")
-            for i, item in enumerate(items, 1):
-                _safe_print(f"  {i}. {item}")
+            body = "".join(f"\n  {i}. {item}" for i, item in enumerate(items, 1))
         else:
-            _safe_print(f"\n[bold cyan]{title}[/bold cyan]")
-            for item in items:
-                _safe_print(f"  • {item}")
-        _safe_print("")
+            body = "".join(f"\n  • {item}" for item in items)
+        _safe_print(f"\n[bold cyan]{title}[/bold cyan]{body}\n")
     except Exception as e:
         logger.error(f"List display failed: {e}")
         print_error(f"Failed to display list: {e}")
@@ -383,6 +489,8 @@ def display_list(title: str, items: List[str], numbered: bool = True):
 def display_panel(content: str, title: str = "", style: str = ""):
     """Display content in a bordered panel."""
     try:
+        from rich.panel import Panel
+        
         panel = Panel(content, title=title, border_style=style)
         _safe_print(panel)
     except Exception as e:
@@ -393,17 +501,23 @@ def display_panel(content: str, title: str = "", style: str = ""):
 def display_git_graph(commits: List[Dict[str, Any]]):
     """Display a git commit graph using rich tree structure."""
     try:
+        from rich.tree import Tree
+        
         tree = Tree(f"{SYMBOLS['clipboard']} Commit History")
+        file_symbol = SYMBOLS['file']
         
-        for commit in commits:
-            commit_hash = commit.get('hash', 'unknown')[:8]
-            author = commit.get('author', 'unknown')
-            message = commit.get('message', 'no message')
-            date = commit.get('date', 'unknown')
-            
-            commit_text = f"[yellow]{commit_hash}[/yellow] [green]{author}[/green] [dim]{date}[/dim]"
-            branch = tree.add(commit_text)
-            branch.add(f"{SYMBOLS['file']} {message}")
+        entries = [
+            (
+                f"[yellow]{commit.get('hash', 'unknown')[:8]}[/yellow] "
+                f"[green]{commit.get('author', 'unknown')}[/green] "
+                f"[dim]{commit.get('date', 'unknown')}[/dim]",
+                f"{file_symbol} {commit.get('message', 'no message')}",
+            )
+            for commit in commits
+        ]
+        
+        for commit_text, message_text in entries:
+            tree.add(commit_text).add(message_text)
         
         _safe_print(tree)
     except Exception as e:
@@ -411,37 +525,65 @@ def display_git_graph(commits: List[Dict[str, Any]]):
         print_error(f"Failed to display git graph: {e}")
 
 
+# Line formats for staged changes, keyed by change type
+_STAGED_FMT = {
+    'renamed': "    [green]renamed:    {}[/green]",
+    'copied': "    [green]copied:     {}[/green]",
+    'deleted': "    [green]deleted:    {}[/green]",
+    'new file': "    [green]new file:   {}[/green]",
+    'modified': "    [green]modified:   {}[/green]",
+}
+
+
 def display_status_summary(status: Dict[str, Any]):
     """Display a comprehensive git status summary similar to git status."""
     try:
-        content = []
+        # Section spacers are folded into the last static line of each
+        # section as a trailing "\n" rather than appended as separate "" items
+        content: List[str] = []
+        dirty = False
         
         # Repository state (merge, rebase, etc.)
         if status.get('repo_state'):
             state = status['repo_state']
             if state == "MERGING":
-                content.append(f"[bold red]{SYMBOLS['warning']} You are in the middle of a merge[/bold red]")
-                content.append("  (fix conflicts and run [yellow]'bit save'[/yellow] to conclude merge)")
+                content.extend((
+                    f"[bold red]{SYMBOLS['warning']} You are in the middle of a merge[/bold red]",
+                    "  (fix conflicts and run [yellow]'bit save'[/yellow] to conclude merge)\n",
+                ))
             elif state == "REBASING":
-                content.append(f"[bold yellow]{SYMBOLS['warning']} You are in the middle of a rebase[/bold yellow]")
-                content.append("  (fix conflicts and run [yellow]'git rebase --continue'[/yellow])")
+                content.extend((
+                    f"[bold yellow]{SYMBOLS['warning']} You are in the middle of a rebase[/bold yellow]",
+                    "  (fix conflicts and run [yellow]'git rebase --continue'[/yellow])\n",
+                ))
             elif state == "CHERRY-PICKING":
-                content.append(f"[bold yellow]{SYMBOLS['warning']} You are in the middle of a cherry-pick[/bold yellow]")
-                content.append("  (fix conflicts and run [yellow]'git cherry-pick --continue'[/yellow])")
+                content.extend((
+                    f"[bold yellow]{SYMBOLS['warning']} You are in the middle of a cherry-pick[/bold yellow]",
+                    "  (fix conflicts and run [yellow]'git cherry-pick --continue'[/yellow])\n",
+                ))
             elif state == "REVERTING":
-                content.append(f"[bold yellow]{SYMBOLS['warning']} You are in the middle of a revert[/bold yellow]")
-                content.append("  (fix conflicts and run [yellow]'git revert --continue'[/yellow])")
+                content.extend((
+                    f"[bold yellow]{SYMBOLS['warning']} You are in the middle of a revert[/bold yellow]",
+                    "  (fix conflicts and run [yellow]'git revert --continue'[/yellow])\n",
+                ))
             elif state == "BISECTING":
-                content.append(f"[bold cyan]{SYMBOLS['info']} You are in the middle of a bisect[/bold cyan]")
-                content.append("  (run [yellow]'git bisect good/bad'[/yellow] to continue)")
-            content.append("")
+                content.extend((
+                    f"[bold cyan]{SYMBOLS['info']} You are in the middle of a bisect[/bold cyan]",
+                    "  (run [yellow]'git bisect good/bad'[/yellow] to continue)\n",
+                ))
         
         # Branch information
         if status.get('branch'):
             branch_line = f"{SYMBOLS['branch']} On branch [bold cyan]{status['branch']}[/bold cyan]"
             
             # Add remote tracking info
-            if status.get('remote_branch'):
+            if status.get('upstream_gone'):
+                content.extend((
+                    branch_line,
+                    f"  Your branch is based on '{status['remote_branch']}', but the upstream is gone.",
+                    "  (use [yellow]'git branch --unset-upstream'[/yellow] to fixup)\n",
+                ))
+            elif status.get('remote_branch'):
                 remote = status['remote_branch']
                 branch_line += f" tracking [cyan]{remote}[/cyan]"
                 
@@ -450,121 +592,130 @@ def display_status_summary(status: Dict[str, Any]):
                 behind = status.get('behind', 0)
                 
                 if ahead > 0 and behind > 0:
-                    content.append(branch_line)
-                    content.append(f"  Your branch and '{remote}' have diverged,")
-                    content.append(f"  and have {ahead} and {behind} different commits each, respectively.")
-                    content.append("  (use [yellow]'bit pull'[/yellow] to merge the remote branch into yours)")
+                    content.extend((
+                        branch_line,
+                        f"  Your branch and '{remote}' have diverged,",
+                        f"  and have {ahead} and {behind} different commits each, respectively.",
+                        "  (use [yellow]'bit pull'[/yellow] to merge the remote branch into yours)\n",
+                    ))
                 elif ahead > 0:
-                    content.append(branch_line)
-                    content.append(f"  Your branch is ahead of '{remote}' by {ahead} commit{'s' if ahead != 1 else ''}.")
-                    content.append("  (use [yellow]'bit push'[/yellow] to publish your local commits)")
+                    content.extend((
+                        branch_line,
+                        f"  Your branch is ahead of '{remote}' by {ahead} commit{'s' if ahead != 1 else ''}.",
+                        "  (use [yellow]'bit push'[/yellow] to publish your local commits)\n",
+                    ))
                 elif behind > 0:
-                    content.append(branch_line)
-                    content.append(f"  Your branch is behind '{remote}' by {behind} commit{'s' if behind != 1 else ''}.")
-                    content.append("  (use [yellow]'bit pull'[/yellow] to update your local branch)")
+                    content.extend((
+                        branch_line,
+                        f"  Your branch is behind '{remote}' by {behind} commit{'s' if behind != 1 else ''}.",
+                        "  (use [yellow]'bit pull'[/yellow] to update your local branch)\n",
+                    ))
                 else:
-                    content.append(branch_line)
-                    content.append(f"  Your branch is up to date with '{remote}'.")
+                    content.extend((
+                        branch_line,
+                        f"  Your branch is up to date with '{remote}'.\n",
+                    ))
+            elif not status.get('has_commits', True):
+                content.extend((branch_line, "  No commits yet.\n"))
             else:
-                content.append(branch_line)
-                # Check if this branch has no upstream
-                try:
-                    from .core.git import run_git_command
-                    run_git_command(['rev-parse', '--abbrev-ref', '@{upstream}'])
-                except:
-                    content.append("  No commits yet.")
-            
-            content.append("")
+                content.append(branch_line + "\n")
         
         # Merge conflicts
         if status.get('merge_conflicts'):
+            dirty = True
             conflicts = status['merge_conflicts']
-            content.append(f"[bold red]{SYMBOLS['error']} You have unmerged paths.[/bold red]")
-            content.append("  (fix conflicts and run [yellow]'bit save'[/yellow] to conclude merge)")
-            content.append("  (use [yellow]'bit save --abort'[/yellow] to abort the merge)")
-            content.append("")
-            content.append(f"[bold red]Unmerged paths:[/bold red]")
-            content.append("  (use [yellow]'git add <file>...'[/yellow] to mark resolution)")
-            for file in conflicts[:10]:  # Limit display to first 10
+            content.extend((
+                f"[bold red]{SYMBOLS['error']} You have unmerged paths.[/bold red]",
+                "  (fix conflicts and run [yellow]'bit save'[/yellow] to conclude merge)",
+                "  (use [yellow]'bit save --abort'[/yellow] to abort the merge)\n",
+                f"[bold red]Unmerged paths:[/bold red]",
+                "  (use [yellow]'git add <file>...'[/yellow] to mark resolution)",
+            ))
+            shown = conflicts[:10]  # Limit display to first 10
+            overflow = len(conflicts) - len(shown)
+            for file in shown:
                 content.append(f"    [red]both modified:   {file}[/red]")
-            if len(conflicts) > 10:
-                content.append(f"    ... and {len(conflicts) - 10} more files")
+            if overflow:
+                content.append(f"    ... and {overflow} more files")
             content.append("")
         
         # Changes to be committed (staged)
-        staged_files = []
-        if status.get('staged'):
-            for item in status['staged']:
-                if isinstance(item, tuple):
-                    staged_files.append(item)
-                else:
-                    staged_files.append((item, 'modified'))
-        if status.get('renamed'):
-            staged_files.extend([(f, 'renamed') for f in status['renamed']])
-        if status.get('copied'):
-            staged_files.extend([(f, 'copied') for f in status['copied']])
+        staged_files = [
+            item if type(item) is tuple else (item, 'modified')
+            for item in status.get('staged') or ()
+        ]
+        staged_files += [(f, 'renamed') for f in status.get('renamed') or ()]
+        staged_files += [(f, 'copied') for f in status.get('copied') or ()]
         
         if staged_files:
-            content.append(f"[bold green]Changes to be committed:[/bold green]")
-            content.append("  (use [yellow]'bit undo'[/yellow] to unstage)")
-            for file, change_type in staged_files[:15]:  # Limit display
-                if change_type == 'renamed':
-                    content.append(f"    [green]renamed:    {file}[/green]")
-                elif change_type == 'copied':
-                    content.append(f"    [green]copied:     {file}[/green]")
-                elif change_type == 'deleted':
-                    content.append(f"    [green]deleted:    {file}[/green]")
-                elif change_type == 'new file':
-                    content.append(f"    [green]new file:   {file}[/green]")
-                else:
-                    content.append(f"    [green]modified:   {file}[/green]")
-            if len(staged_files) > 15:
-                content.append(f"    ... and {len(staged_files) - 15} more files")
+            dirty = True
+            content.extend((
+                f"[bold green]Changes to be committed:[/bold green]",
+                "  (use [yellow]'bit undo'[/yellow] to unstage)",
+            ))
+            shown = staged_files[:15]  # Limit display
+            overflow = len(staged_files) - len(shown)
+            for file, change_type in shown:
+                content.append(_STAGED_FMT.get(change_type, _STAGED_FMT['modified']).format(file))
+            if overflow:
+                content.append(f"    ... and {overflow} more files")
             content.append("")
         
         # Changes not staged for commit (modified)
         if status.get('modified'):
+            dirty = True
             modified = status['modified']
-            content.append(f"[bold red]Changes not staged for commit:[/bold red]")
-            content.append("  (use [yellow]'bit save'[/yellow] to stage and commit)")
-            content.append("  (use [yellow]'git checkout -- <file>...'[/yellow] to discard changes)")
-            for file in modified[:15]:  # Limit display
+            content.extend((
+                f"[bold red]Changes not staged for commit:[/bold red]",
+                "  (use [yellow]'bit save'[/yellow] to stage and commit)",
+                "  (use [yellow]'git checkout -- <file>...'[/yellow] to discard changes)",
+            ))
+            shown = modified[:15]  # Limit display
+            overflow = len(modified) - len(shown)
+            for file in shown:
                 content.append(f"    [red]modified:   {file}[/red]")
-            if len(modified) > 15:
-                content.append(f"    ... and {len(modified) - 15} more files")
+            if overflow:
+                content.append(f"    ... and {overflow} more files")
             content.append("")
         
         # Untracked files
         if status.get('untracked'):
+            dirty = True
             untracked = status['untracked']
-            content.append(f"[bold red]Untracked files:[/bold red]")
-            content.append("  (use [yellow]'bit save'[/yellow] to include in what will be committed)")
-            for file in untracked[:15]:  # Limit display
+            content.extend((
+                f"[bold red]Untracked files:[/bold red]",
+                "  (use [yellow]'bit save'[/yellow] to include in what will be committed)",
+            ))
+            shown = untracked[:15]  # Limit display
+            overflow = len(untracked) - len(shown)
+            for file in shown:
                 content.append(f"    [red]{file}[/red]")
-            if len(untracked) > 15:
-                content.append(f"    ... and {len(untracked) - 15} more files")
+            if overflow:
+                content.append(f"    ... and {overflow} more files")
             content.append("")
         
         # Stash information
         if status.get('stash_count', 0) > 0:
             stash_count = status['stash_count']
-            content.append(f"{SYMBOLS['stash']} You have {stash_count} stash{'es' if stash_count != 1 else ''}")
-            content.append("  (use [yellow]'bit list stashes'[/yellow]s to see them)")
-            content.append("")
+            content.extend((
+                f"{SYMBOLS['stash']} You have {stash_count} stash{'es' if stash_count != 1 else ''}",
+                "  (use [yellow]'bit list stashes'[/yellow]s to see them)\n",
+            ))
         
         # Clean working directory message
-        if not any([
-            status.get('staged'), status.get('modified'), status.get('untracked'),
-            status.get('merge_conflicts'), status.get('renamed'), status.get('copied')
-        ]):
+        if not dirty:
             if status.get('ahead', 0) == 0 and status.get('behind', 0) == 0:
                 content.append(f"[bold green]{SYMBOLS['success']} Nothing to commit, working tree clean[/bold green]")
             else:
                 content.append(f"[bold green]{SYMBOLS['success']} Working tree clean[/bold green]")
         
-        # Display the content
-        if content:
-            console.print("\n".join(content))
+        # Display the content. Only lines with style tags need Rich's markup
+        # parser; runs of plain lines are written straight to stdout.
+        for has_markup, group in groupby(content, key=lambda line: '[' in line):
+            if has_markup:
+                console.print("\n".join(group))
+            else:
+                console.file.write("\n".join(group) + "\n")
         
     except Exception as e:
         logger.error(f"Status display failed: {e}")
@@ -0,0 +1,77 @@
+"""Tests for BetterGit command-line helpers."""
+
+from unittest.mock import patch
+from bettergit.cli import _show_git_status
+
+
+def _status_info(porcelain: str) -> dict:
+    """Run _show_git_status on canned porcelain output and return the status dict."""
+    with patch('bettergit.cli.run_git_command', return_value=(porcelain, "", 0)), \
+         patch('bettergit.cli.get_current_branch', return_value='main'), \
+         patch('bettergit.cli.display_status_summary') as display:
+        _show_git_status()
+    display.assert_called_once()
+    return display.call_args[0][0]
+
+
+class TestShowGitStatus:
+    """Test parsing of `git status --porcelain --branch` output."""
+    
+    def test_ahead_and_behind(self):
+        """Test tracking branch with ahead/behind counts."""
+        info = _status_info("## main...origin/main [ahead 1, behind 2]")
+        
+        assert info['remote_branch'] == 'origin/main'
+        assert info['ahead'] == 1
+        assert info['behind'] == 2
+        assert info['upstream_gone'] is False
+        assert info['has_commits'] is True
+    
+    def test_up_to_date(self):
+        """Test tracking branch with no divergence."""
+        info = _status_info("## main...origin/main")
+        
+        assert info['remote_branch'] == 'origin/main'
+        assert info['ahead'] == 0
+        assert info['behind'] == 0
+    
+    def test_no_upstream(self):
+        """Test branch without an upstream."""
+        info = _status_info("## main")
+        
+        assert info['remote_branch'] is None
+        assert info['has_commits'] is True
+    
+    def test_no_commits_yet(self):
+        """Test freshly initialised repository."""
+        info = _status_info("## No commits yet on main\n?? new.txt")
+        
+        assert info['has_commits'] is False
+        assert info['remote_branch'] is None
+        assert info['untracked'] == ['new.txt']
+    
+    def test_detached_head(self):
+        """Test detached HEAD header."""
+        info = _status_info("## HEAD (no branch)")
+        
+        assert info['remote_branch'] is None
+        assert info['has_commits'] is True
+        assert info['ahead'] == 0
+        assert info['behind'] == 0
+    
+    def test_upstream_gone(self):
+        """Test deleted upstream is flagged rather than reported up to date."""
+        info = _status_info("## main...origin/main [gone]")
+        
+        assert info['remote_branch'] == 'origin/main'
+        assert info['upstream_gone'] is True
+        assert info['ahead'] == 0
+        assert info['behind'] == 0
+    
+    def test_file_lines_after_header(self):
+        """Test file entries are parsed without the header line."""
+        info = _status_info("## main\n M changed.py\nA  added.py\n?? new.py")
+        
+        assert info['modified'] == ['changed.py']
+        assert info['staged'] == ['added.py']
+        assert info['untracked'] == ['new.py']
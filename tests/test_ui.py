@@ -0,0 +1,64 @@
+"""Tests for BetterGit user interface helpers."""
+
+import os
+import pytest
+from unittest.mock import patch
+from bettergit.ui import select_undo_point, _split_unix_keys
+
+
+CHOICES = ["first", "second", "third", "fourth"]
+
+
+class TestSplitUnixKeys:
+    """Test splitting raw terminal input into keys."""
+    
+    def test_coalesced_arrows(self):
+        """Test several arrow sequences in one read are split apart."""
+        assert _split_unix_keys(b'\x1b[B\x1b[B') == [b'\x1b[B', b'\x1b[B']
+    
+    def test_lone_escape(self):
+        """Test a bare ESC is returned as its own key."""
+        assert _split_unix_keys(b'\x1b') == [b'\x1b']
+    
+    def test_other_sequences_kept_whole(self):
+        """Test unrelated escape sequences are not split into loose bytes."""
+        assert _split_unix_keys(b'\x1b[1;5C\r') == [b'\x1b[1;5C', b'\r']
+
+
+@pytest.mark.skipif(os.name == 'nt', reason="Unix terminal handling")
+class TestSelectUndoPointUnix:
+    """Test the Unix key loop of select_undo_point against a pseudo-terminal."""
+    
+    def setup_method(self):
+        """Open a pty to stand in for the user's terminal."""
+        self.master, self.slave = os.openpty()
+        self.stdin = os.fdopen(self.slave, 'r')
+    
+    def teardown_method(self):
+        """Close the pty."""
+        self.stdin.close()
+        os.close(self.master)
+    
+    def run_menu(self, chunks, pending=True):
+        """Run the menu with os.read returning the given chunks in order."""
+        with patch('sys.stdin', self.stdin), \
+             patch('bettergit.ui.os.read', side_effect=chunks), \
+             patch('bettergit.ui.select.select',
+                   return_value=([self.slave] if pending else [], [], [])):
+            return select_undo_point("Pick", CHOICES)
+    
+    def test_split_arrow_sequence(self):
+        """Test an arrow whose bytes arrive in separate reads still moves."""
+        assert self.run_menu([b'\x1b', b'[B', b'\r']) == 1
+    
+    def test_coalesced_arrow_sequences(self):
+        """Test every arrow in a single read is applied."""
+        assert self.run_menu([b'\x1b[B\x1b[B', b'\r']) == 2
+    
+    def test_arrows_and_enter_in_one_read(self):
+        """Test keys after an arrow in the same read are still handled."""
+        assert self.run_menu([b'\x1b[B\x1b[B\x1b[A\r']) == 1
+    
+    def test_bare_escape_cancels(self):
+        """Test ESC with nothing following cancels the selection."""
+        assert self.run_menu([b'\x1b'], pending=False) is None